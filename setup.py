@@ -1,27 +1,34 @@
-from os import linesep
-from os.path import dirname
-from yaml import safe_load
-from re import compile, search
+import json
+from io import StringIO
+from os.path import isfile, join
+from pathlib import Path
+from pprint import pformat
+import yaml
+from re import compile
 from setuptools import setup
 from versioneer import get_cmdclass
-from tempfile import NamedTemporaryFile
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+CONDA_META_FILE = "conda.recipe/meta.yaml"
+# Generated from CONDA_META_FILE by tools/refresh_meta_json.py,
+# tests/test_setup.py checks that it is in sync with CONDA_META_FILE
+CONDA_META_JSON_FILE = "conda.recipe/meta.json"
 
 
 def get_conda_metadata(conda_meta_file: str) -> dict:
-    with open(conda_meta_file, mode="r") as actual, NamedTemporaryFile(
-        mode="r+", dir=dirname(conda_meta_file), encoding="UTF-8", newline=linesep
-    ) as temp:
-        metadata_vars = {}
-        metadata_rgx = compile(r"""^{%\s+set\s+(\S+)\s+=\s+(\S+)\s+%}""")
-        for i, line in enumerate(actual):
-            m = search(pattern=metadata_rgx, string=line)
+    metadata_vars = {}
+    metadata_rgx = compile(r"""^{%\s+set\s+(\S+)\s+=\s+(\S+)\s+%}""")
+    # Jinja2 "set" lines are not valid YAML, so they are kept out of the parsed text
+    with open(conda_meta_file, mode="r", encoding="UTF-8") as actual, StringIO() as buf:
+        for line in actual:
+            m = metadata_rgx.match(line)
             if m:
-                metadata_vars[i] = (m.groups()[0], m.groups()[1].strip('"'))
+                metadata_vars[m.group(1)] = m.group(2).strip('"')
             else:
-                temp.write(line)
-        temp.seek(0)
-        conda_metadata = safe_load(temp)
-    for _, (metavar_key, metavar_value) in metadata_vars.items():
+                buf.write(line)
+        buf.seek(0)
+        conda_metadata = yaml.load(buf, Loader=YAML_LOADER)
+    for metavar_key, metavar_value in metadata_vars.items():
         if metavar_key == "org":
             for k1, k2 in [("source", "url"), ("about", "home")]:
                 conda_metadata[k1][k2] = conda_metadata[k1][k2].replace(
@@ -45,37 +52,68 @@ def get_conda_metadata(conda_meta_file: str) -> dict:
     return conda_metadata
 
 
-conda_metadata = get_conda_metadata("conda.recipe/meta.yaml")
-requirements = conda_metadata["requirements"]["run"]
+def load_conda_metadata() -> dict:
+    # The JSON sidecar is used whenever it exists, the conda recipe is only parsed without it
+    if isfile(CONDA_META_JSON_FILE):
+        with open(CONDA_META_JSON_FILE, mode="r", encoding="UTF-8") as fp:
+            return json.load(fp)
+    return get_conda_metadata(CONDA_META_FILE)
+
+
+def get_cmdclass_with_logger_settings() -> dict:
+    cmdclass = get_cmdclass()
+    _build_py = cmdclass["build_py"]
+
+    class build_py(_build_py):
+        """Extends the versioneer build_py command to write the parsed
+        logger settings into the built package as a Python module,
+        so that importing the package does not need to parse YAML."""
+
+        def run(self):
+            _build_py.run(self)
+            with open(join("t1dgrs2", "logger_settings.yml"), mode="r", encoding="UTF-8") as fp:
+                logger_settings = yaml.load(fp, Loader=YAML_LOADER)
+            target = join(self.build_lib, "t1dgrs2", "_logger_settings.py")
+            with open(target, mode="w", encoding="UTF-8") as fp:
+                fp.write("# Generated by setup.py from logger_settings.yml, do not edit.\n\n")
+                fp.write(f"LOGGER_SETTINGS = {pformat(logger_settings)}\n")
+
+    cmdclass["build_py"] = build_py
+    return cmdclass
+
+
+# Guarded so that tools/refresh_meta_json.py can import get_conda_metadata
+if __name__ == "__main__":
+    conda_metadata = load_conda_metadata()
+    requirements = conda_metadata["requirements"]["run"]
 
-# Read in the requirements.txt file
-# with open("requirements.txt") as f:
-#     requirements = []
-#     for library in f.read().splitlines():
-#         requirements.append(library)
+    # Read in the requirements.txt file
+    # with open("requirements.txt") as f:
+    #     requirements = []
+    #     for library in f.read().splitlines():
+    #         requirements.append(library)
 
-with open("README.md", "r") as fh:
-    long_description = fh.read()
+    long_description = Path("README.md").read_text(encoding="UTF-8")
 
-setup(
-    name="t1dgrs2",
-    version=0,
-    cmdclass=get_cmdclass(),
-    description="Generate a Type 1 Diabetes Genetic Risk Score that accounts for interactions between HLA-DQ variants.",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    license="GNUv3",
-    author="Ankit Arni",
-    author_email="A.M.Arni@exeter.ac.uk",
-    url="https://github.com/ama249/t1dgrs2",
-    packages=["t1dgrs2"],
-    python_requires=">=3.11.0",
-    install_requires=requirements,
-    include_package_data=True,
-    keywords="t1dgrs2",
-    classifiers=[
-        "Programming Language :: Python :: 3.11",
-        "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",
-        "Operating System :: POSIX :: Linux",
-    ],
-)
+    setup(
+        name="t1dgrs2",
+        version=0,
+        cmdclass=get_cmdclass_with_logger_settings(),
+        description="Generate a Type 1 Diabetes Genetic Risk Score that accounts for interactions between HLA-DQ variants.",
+        long_description=long_description,
+        long_description_content_type="text/markdown",
+        license="GNUv3",
+        author="Ankit Arni",
+        author_email="A.M.Arni@exeter.ac.uk",
+        url="https://github.com/ama249/t1dgrs2",
+        packages=["t1dgrs2"],
+        python_requires=">=3.11.0",
+        install_requires=requirements,
+        include_package_data=True,
+        keywords="t1dgrs2",
+        classifiers=[
+            "Programming Language :: Python :: 3.11",
+            "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",
+            "Operating System :: POSIX :: Linux",
+        ],
+    )
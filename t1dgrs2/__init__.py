@@ -1,39 +1,60 @@
 #!/usr/bin/env python3
 
 from os import path
-from yaml import safe_load
-from pkgutil import walk_packages
 from importlib import import_module
-from logging.config import dictConfig
+from importlib.util import find_spec
 from ._version import get_versions
 
 __version__ = get_versions()["version"]
 _ROOT_DIR = path.dirname(path.dirname(path.realpath(__file__)))
 _EXIT_MSG = "Exiting with error."
+_SUBMODULES = ("common", "score", "metrics")
+# Optional, delimited files are read and written with pyarrow when it is installed
+_HAS_PYARROW = find_spec("pyarrow") is not None
 
+__all__ = ["common", "score", "metrics", "configure_logging", "__version__"]
 
-def import_submodules(package, recursive=True):
-    if isinstance(package, str):
-        package = import_module(package)
-    results = {}
-    for _, name, is_pkg in walk_packages(package.__path__):
-        full_name = package.__name__ + "." + name
-        if name != "__main__":
-            results[full_name] = import_module(full_name)
-        if recursive and is_pkg:
-            results.update(import_submodules(full_name))
-    return results
 
+def __getattr__(name):
+    # Submodules are imported on first access rather than at package import
+    if name in _SUBMODULES:
+        module = import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-import_submodules(__name__, recursive=True)
 
-with open(
-    path.join(_ROOT_DIR, __package__, "logger_settings.yml"),
-    mode="r",
-    encoding="UTF-8",
-) as fp:
-    dictConfig(safe_load(fp))
+_logging_configured = False
 
-del fp, path
-del get_versions, safe_load, walk_packages, import_module, dictConfig
-del import_submodules
+
+def configure_logging() -> None:
+    """Configure the package loggers from the logger settings.
+
+    Only the first call has an effect, so that repeated calls do not
+    reconfigure every existing logger.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    from logging.config import dictConfig
+
+    try:
+        # Generated from logger_settings.yml at build time by setup.py
+        from ._logger_settings import LOGGER_SETTINGS as logger_settings
+    except ImportError:
+        # YAML is only imported when the generated module is not available
+        import yaml
+
+        with open(
+            path.join(_ROOT_DIR, __package__, "logger_settings.yml"),
+            mode="r",
+            encoding="UTF-8",
+        ) as fp:
+            logger_settings = yaml.load(
+                fp, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            )
+    dictConfig(logger_settings)
+    _logging_configured = True
+
+
+del find_spec, get_versions
@@ -2,12 +2,14 @@
 
 import os
 from sys import exit
-from yaml import safe_load
 from logging import getLogger
 from argparse import ArgumentParser
 
-from t1dgrs2 import common, score, metrics, _EXIT_MSG, __version__
+from t1dgrs2 import common, score, metrics, configure_logging
+from t1dgrs2 import _EXIT_MSG, __version__
 
+# Configured before creating this module's logger, so that it is not disabled
+configure_logging()
 _LOG = getLogger(__name__)
 
 
@@ -23,8 +25,11 @@ def main(plink_bfile: str, config_file: str, plink_out: str) -> None:
         f"Running main(plink_bfile='{plink_bfile}', config_file='{config_file}', plink_out='{plink_out}')"
     )
     try:
+        # YAML is imported here, so that importing the package does not require it
+        import yaml
+
         with open(config_file, mode="r", encoding="UTF-8") as f:
-            config = safe_load(f)
+            config = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
         plink_out_check = True if os.sep in plink_out else False
         if plink_out_check:
             os.makedirs(os.path.dirname(plink_out), exist_ok=True)
@@ -33,36 +38,37 @@ def main(plink_bfile: str, config_file: str, plink_out: str) -> None:
         _LOG.error(_EXIT_MSG)
         exit(1)
 
+    # Resolve every input and output path once up-front
+    dq_rank_file = os.path.realpath(config["input"]["dq_rank"])
+    hla_map_file = os.path.realpath(config["input"]["hla_map"])
+    dosage_file = os.path.realpath(f"{plink_out}_dosage.tsv")
+    geno_file = os.path.realpath(f"{plink_out}_DQ_calls.tsv")
+    results_file = os.path.realpath(f"{plink_out}_RESULTS.tsv")
+
     df_vmap = score.fix_variant_alleles(
-        rdqfile=os.path.realpath(config["input"]["dq_rank"]),
+        rdqfile=dq_rank_file,
         bfile=plink_bfile,
         ofile=plink_out,
-        mfile=os.path.realpath(config["input"]["hla_map"]),
+        mfile=hla_map_file,
     )
     df_vmap.attrs["name"] = "Mapping & frequency data"
     df_dosage = score.create_dosage_table(
         df_vmap=df_vmap, bfile=plink_bfile, ofile=plink_out
     )
     df_dosage.attrs["name"] = "Dosage data for all mapped alleles"
-    dosage_file = os.path.realpath(f"{plink_out}_dosage.tsv")
     _LOG.info(f"Writing dosage data to '{dosage_file}'")
-    df_dosage.to_csv(
-        dosage_file, sep="\t", na_rep="", header=True, index=False, encoding="UTF-8"
-    )
+    common.write_dataframe(df_dosage, dosage_file, sep="\t")
     df_geno = score.get_geno_call_alleles(
         df_dsg=df_dosage, alleles=df_vmap["ALLELE"].to_list()
     )
     df_geno.attrs["name"] = "Genotype calls for all mapped alleles"
-    geno_file = os.path.realpath(f"{plink_out}_DQ_calls.tsv")
     _LOG.info(f"Writing DQ calls data to '{geno_file}'")
-    df_geno.to_csv(
-        geno_file, sep="\t", na_rep="", header=True, index=False, encoding="UTF-8"
-    )
+    common.write_dataframe(df_geno, geno_file, sep="\t")
     df_scores = score.generate_grs(
         df_geno=df_geno,
         bfile=plink_bfile,
         ofile=plink_out,
-        rdqfile=os.path.realpath(config["input"]["dq_rank"]),
+        rdqfile=dq_rank_file,
         sc_int=os.path.realpath(config["scores"]["interaction"]),
         sc_plink_all=os.path.realpath(config["scores"]["all_variants"]),
         sc_plink_hla=os.path.realpath(config["scores"]["hla_variants"])
@@ -87,11 +93,8 @@ def main(plink_bfile: str, config_file: str, plink_out: str) -> None:
             "name"
         ] = "Calculated GRS, centiles, PPV and probability for all given variants"
 
-    results_file = os.path.realpath(f"{plink_out}_RESULTS.tsv")
     _LOG.info(f"Writing results to '{results_file}'")
-    df_scores.to_csv(
-        results_file, sep="\t", na_rep="", header=True, index=False, encoding="UTF-8"
-    )
+    common.write_dataframe(df_scores, results_file, sep="\t")
 
 
 if __name__ == "__main__":
@@ -14,39 +14,74 @@ Methods:
     - validate_textfile : Helper function to validate a text-based file given its path.
     - read_dataframe : Helper function to read in a pandas DataFrame 
     from a delimited text file.
+    - write_dataframe : Helper function to write a pandas DataFrame 
+    to a delimited text file.
 """
 
 # Standard imports
 import os as _os
+from shlex import split as _split
+from functools import lru_cache as _lru_cache
+from collections.abc import Iterator as _Iterator
 from logging import getLogger as _getLogger
 from pandas import DataFrame as _DataFrame, read_csv as _read_csv
 from subprocess import run as _run, CalledProcessError as _CalledProcessError
 
 # Module imports
-from . import _EXIT_MSG
+from . import _EXIT_MSG, _HAS_PYARROW
 
 _LOG = _getLogger(__name__)
+_BED_MAGIC_NUM = b"\x6c\x1b\x01"
 
 
-def run_shell_cmd(cmd: str) -> str:
+@_lru_cache(maxsize=None)
+def _split_cmd(cmd: str) -> tuple[str, ...]:
+    """Split a shell command string into its arguments, caching the result."""
+    return tuple(_split(cmd))
+
+
+def run_shell_cmd(cmd: list[str] | str) -> str:
     """Execute a given shell command.
 
     Args:
-        - cmd (str) : Given shell command string with all required arguments substituted in.
+        - cmd (list[str] | str) : Given shell command as a list of arguments, 
+        or as a string with all required arguments substituted in.
 
     Returns:
         str : Standard output of the shell command on successful execution.
     """
     _LOG.debug(f'Executing: run_shell_cmd(cmd="{cmd}")')
+    argv: list[str] = list(_split_cmd(cmd)) if isinstance(cmd, str) else cmd
     try:
         exc = _run(
-            cmd, shell=True, check=True, capture_output=True, text=True, timeout=300
+            argv, shell=False, check=True, capture_output=True, text=True, timeout=300
         )
         return exc.stdout.strip()
     except _CalledProcessError as e:
         _LOG.exception(e.stderr)
         _LOG.error(_EXIT_MSG)
         raise e
+    except OSError as e:
+        _LOG.exception(e)
+        _LOG.error(_EXIT_MSG)
+        raise e
+
+
+def _iter_files(dirpath: str) -> _Iterator[str]:
+    """Recursively yield the paths of all files within a given path, using the
+    file type cached in each directory entry instead of a stat call per file.
+    Directories that cannot be listed (e.g. missing or unreadable) are skipped, 
+    as with os.walk."""
+    try:
+        entries = _os.scandir(dirpath)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
 
 
 def delete_files_within(dirpath: str, pattern: str | None = None) -> None:
@@ -61,14 +96,9 @@ def delete_files_within(dirpath: str, pattern: str | None = None) -> None:
         f"""Executing: delete_files_within(path='{dirpath}', pattern={"'"+pattern+"'" if pattern is not None else None})"""
     )
     try:
-        for r, _, fs in _os.walk(dirpath):
-            for f in fs:
-                file: str = _os.path.join(r, f)
-                if _os.path.isfile(file):
-                    if pattern is None:
-                        _os.remove(file)
-                    elif pattern is not None and pattern in file:
-                        _os.remove(file)
+        for file in _iter_files(dirpath):
+            if pattern is None or pattern in file:
+                _os.remove(file)
     except Exception as e:
         _LOG.exception(e)
         _LOG.error(_EXIT_MSG)
@@ -88,10 +118,9 @@ def validate_plinkfiles(arg: str) -> str:
     try:
         bed = _os.path.realpath(f"{arg}.bed")
         with open(bed, mode="rb") as fbed:
-            bed_magic_num = [108, 27, 1]
-            assert [
-                byte for byte in bytearray(fbed.read(3))
-            ] == bed_magic_num, f"File '{bed}' is not a PLINK .bed file."
+            assert (
+                fbed.read(3) == _BED_MAGIC_NUM
+            ), f"File '{bed}' is not a PLINK .bed file."
             _LOG.info(f"File found: '{bed}'")
         validate_textfile(f"{arg}.bim")
         validate_textfile(f"{arg}.fam")
@@ -138,16 +167,73 @@ def read_dataframe(
         - dtype (dict[str, type] | None, optional): Optional dictionary of column names
         and data types to be applied when reading in the given file.
 
+    Uses the pyarrow CSV reader for single character separators if pyarrow 
+    is installed, otherwise the pandas C parser.
+
     Returns:
         pandas.DataFrame: Resulting DataFrame object.
     """
     _LOG.debug(
         f"Executing: read_dataframe(file='{file}', sep='{sep}', usecols={usecols}, dtype={dtype}')"
     )
+    # pyarrow only supports single character separators, regex separators such as
+    # r"\s+" (used for PLINK output) are handled by the pandas C whitespace tokenizer
+    engine: str = "pyarrow" if _HAS_PYARROW and len(sep) == 1 else "c"
     try:
-        df: _DataFrame = _read_csv(file, sep=sep, usecols=usecols, dtype=dtype)
+        df: _DataFrame = _read_csv(
+            file, sep=sep, usecols=usecols, dtype=dtype, engine=engine
+        )
         return df
     except Exception as e:
         _LOG.exception(e)
         _LOG.error(_EXIT_MSG)
         raise e
+
+
+def write_dataframe(
+    df: _DataFrame, file: str, sep: str, header: bool = True
+) -> None:
+    """Helper function to write a pandas DataFrame to a delimited text file.
+
+    Uses the pyarrow CSV writer if pyarrow is installed, otherwise pandas.
+    Missing values are written as empty fields and the index is not written.
+
+    Args:
+        - df (pandas.DataFrame): DataFrame object to write out.
+        - file (str): Path of the output file.
+        - sep (str): Column separator to use in the output file.
+        - header (bool, optional): Whether to write the column names 
+        as the first line (default).
+    """
+    _LOG.debug(
+        f"Executing: write_dataframe(df='{df.attrs.get('name')}', "
+        + f"file='{file}', sep='{sep}', header={header})"
+    )
+    try:
+        if _HAS_PYARROW:
+            from pyarrow import ArrowException as _ArrowException
+            from pyarrow import Table as _Table, csv as _pacsv
+
+            try:
+                with open(file, mode="wb") as f:
+                    # Written separately, as the pyarrow writer always quotes the header
+                    if header:
+                        f.write((sep.join(map(str, df.columns)) + "\n").encode("UTF-8"))
+                    _pacsv.write_csv(
+                        _Table.from_pandas(df, preserve_index=False),
+                        f,
+                        write_options=_pacsv.WriteOptions(
+                            include_header=False, delimiter=sep, quoting_style="none"
+                        ),
+                    )
+                return
+            except _ArrowException as e:
+                # e.g. columns of Python lists, which the pyarrow writer does not support
+                _LOG.debug(f"Falling back to pandas to write '{file}': {e}")
+        df.to_csv(
+            file, sep=sep, na_rep="", header=header, index=False, encoding="UTF-8"
+        )
+    except Exception as e:
+        _LOG.exception(e)
+        _LOG.error(_EXIT_MSG)
+        raise e
@@ -13,16 +13,22 @@ Methods:
     as a case, using pre-computed two-sample t-test statistics.
 """
 
+from __future__ import annotations
+
 # Standard imports
-import pandas as _pd
 from sys import exit as _exit
-from logging import getLogger as _getLogger
-from numpy import exp as _exp, nan as _NAN
+from typing import TYPE_CHECKING
+from logging import getLogger as _getLogger, DEBUG as _DEBUG
+
+# pandas & numpy are imported within each method, so that importing this module stays cheap
+if TYPE_CHECKING:
+    import pandas as _pd
 
 # Module imports
-from . import _EXIT_MSG
+from . import _EXIT_MSG, _HAS_PYARROW
 
 _LOG = _getLogger(__name__)
+_CSV_ENGINE = "pyarrow" if _HAS_PYARROW else "c"
 
 
 def retrieve_centiles(df_scores: _pd.DataFrame, rfile: str) -> _pd.DataFrame:
@@ -37,9 +43,15 @@ def retrieve_centiles(df_scores: _pd.DataFrame, rfile: str) -> _pd.DataFrame:
     Returns:
         pandas.DataFrame : Updated with control/case centiles and PPV values per individual.
     """
-    _LOG.debug(
-        f"""Executing: retrieve_centiles(df_scores='{df_scores.attrs["name"]}', rfile: str)"""
-    )
+    import numpy as _np
+    import pandas as _pd
+
+    if _LOG.isEnabledFor(_DEBUG):
+        _LOG.debug(
+            "Executing: retrieve_centiles("
+            + f"""df_scores='{df_scores.attrs.get("name")}', """
+            + "rfile: str)"
+        )
     _LOG.info(
         "Retrieving and assigning pre-computed control/case centiles per individual T1DGRS2"
     )
@@ -48,54 +60,38 @@ def retrieve_centiles(df_scores: _pd.DataFrame, rfile: str) -> _pd.DataFrame:
             rfile,
             sep="\t",
             usecols=["threshold", "CtrlPCentile", "CasePCentile", "PPV"],
+            engine=_CSV_ENGINE,
         )
         df_roc.attrs["name"] = "Pre-computed ROC curve threshold and metric values"
         df_roc.rename(
             columns={"CtrlPCentile": "CTRLCENTILE", "CasePCentile": "CASECENTILE"},
             inplace=True,
         )
-        df_roc["SOURCE"] = "ROCFILE"
-        df_scores["SOURCE"] = "SCOREFILE"
     except Exception as e:
         _LOG.exception(e)
         _LOG.error(_EXIT_MSG)
         _exit(1)
-    df_roc_temp: _pd.DataFrame = (
-        df_roc[["threshold", "SOURCE"]]
-        .copy(deep=True)
-        .rename(columns={"threshold": "SCORE"})
+    # Sorting the arrays rather than the DataFrame avoids copying df_roc
+    roc_order = df_roc["threshold"].to_numpy().argsort(kind="stable")
+    thresholds = df_roc["threshold"].to_numpy()[roc_order]
+    roc_values = df_roc[["CTRLCENTILE", "CASECENTILE", "PPV"]].to_numpy()[roc_order]
+    # Each individual is assigned the values of the ROC threshold nearest to their SCORE,
+    # scores outside the threshold range take the values of the first/last threshold
+    scores = df_scores["SCORE"].to_numpy()
+    idx_upper = _np.searchsorted(thresholds, scores)
+    idx_lower = _np.clip(idx_upper - 1, 0, len(thresholds) - 1)
+    idx_upper = _np.clip(idx_upper, 0, len(thresholds) - 1)
+    idx = _np.where(
+        scores - thresholds[idx_lower] <= thresholds[idx_upper] - scores,
+        idx_lower,
+        idx_upper,
     )
-    df_roc_temp[["FID", "IID"]] = _pd.DataFrame(columns=["FID", "IID"], dtype="str")
-    df_roc_temp["DQSCORE"] = _NAN
-    df_roc_temp = df_roc_temp[["SOURCE", "FID", "IID", "SCORE", "DQSCORE"]]
-    df_scores_temp: _pd.DataFrame = df_scores[
-        ["SOURCE", "FID", "IID", "SCORE", "DQSCORE"]
-    ].copy(deep=True)
+    df_scores[["CTRLCENTILE", "CASECENTILE", "PPV"]] = roc_values[idx]
+    # DQSCORE is only calculated if the DQ allele variants score file is configured
+    score_cols = ["SCORE", "DQSCORE"] if "DQSCORE" in df_scores.columns else ["SCORE"]
     df_scores_upd: _pd.DataFrame = (
-        _pd.concat([df_roc_temp, df_scores_temp])
-        .sort_values(by=["SCORE"])
-        .reset_index(drop=True)
-    )
-    del df_scores_temp, df_roc_temp
-    # Merging on the SOURCE column ensures that only the df_roc data rows are updated
-    df_scores_upd = df_scores_upd.merge(
-        df_roc,
-        how="left",
-        left_on=["SOURCE", "SCORE"],
-        right_on=["SOURCE", "threshold"],
-    )
-    # Combination of nearest interpolation, back-fill & forward-fill assigns all individuals their respective centile values
-    # IMPORTANT: SPLINE INTERPOLATION THEORETICALLY BETTER, TO BE TESTED
-    df_scores_upd = df_scores_upd.interpolate(method="nearest").bfill().ffill()
-    # Remove all the df_roc intermediate data rows
-    df_scores_upd = (
-        df_scores_upd.drop(df_scores_upd.loc[df_scores_upd["SOURCE"] == "ROC"].index)
-        .loc[
-            df_scores_upd["SOURCE"] == "SCOREFILE",
-            ["FID", "IID", "SCORE", "DQSCORE", "CTRLCENTILE", "CASECENTILE", "PPV"],
-        ]
-        .sort_values(by=["FID", "IID"])
-        .reset_index(drop=True)
+        df_scores[["FID", "IID"] + score_cols + ["CTRLCENTILE", "CASECENTILE", "PPV"]]
+        .sort_values(by=["FID", "IID"], ignore_index=True)
     )
     return df_scores_upd
 
@@ -112,9 +108,15 @@ def calculate_probs(df_scores: _pd.DataFrame, ffile: str) -> _pd.DataFrame:
         pandas.DataFrame : Updated with the per individual probabilities 
         of being classified as a case.
     """
-    _LOG.debug(
-        f"""Executing: calculate_probs(df_scores='{df_scores.attrs["name"]}', ffile: str)"""
-    )
+    import numpy as _np
+    import pandas as _pd
+
+    if _LOG.isEnabledFor(_DEBUG):
+        _LOG.debug(
+            "Executing: calculate_probs("
+            + f"""df_scores='{df_scores.attrs.get("name")}', """
+            + "ffile: str)"
+        )
     _LOG.info(
         "Calculating the case probability per individual based on "
             + "pre-computed two-sample t-test statistics"
@@ -124,13 +126,20 @@ def calculate_probs(df_scores: _pd.DataFrame, ffile: str) -> _pd.DataFrame:
             ffile,
             sep="\t",
             usecols=["Param", "Estimate", "Std_Error", "t_value", "Pr_gt_t"],
+            engine=_CSV_ENGINE,
         )
         df_fit.attrs["name"] = "Pre-computed two-sample t-test mid and b estimates"
     except Exception as e:
         _LOG.exception(e)
         _LOG.error(_EXIT_MSG)
         _exit(1)
-    b = df_fit.loc[df_fit["Param"] == "b", "Estimate"].item()
-    mid = df_fit.loc[df_fit["Param"] == "mid", "Estimate"].item()
-    df_scores["PROB"] = 1.0 / (1.0 + _exp(b * (mid - df_scores["SCORE"])))
+    estimates: dict[str, float] = dict(zip(df_fit["Param"], df_fit["Estimate"]))
+    b, mid = estimates["b"], estimates["mid"]
+    # PROB = 1 / (1 + exp(b * (mid - SCORE))), computed in-place on a single array
+    prob = _np.subtract(mid, df_scores["SCORE"].to_numpy(dtype=float))
+    _np.multiply(prob, b, out=prob)
+    _np.exp(prob, out=prob)
+    prob += 1.0
+    _np.reciprocal(prob, out=prob)
+    df_scores["PROB"] = prob
     return df_scores
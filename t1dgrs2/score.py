@@ -17,85 +17,88 @@ Methods:
 
 # Standard imports
 import os as _os
-import re as _re
+import glob as _glob
+import numpy as _np
 import pandas as _pd
-from sys import exit as _exit
-from numpy import arange as _arange
-from logging import getLogger as _getLogger
-from numpy import rint as _rint, ubyte as _UBYTE
+from logging import getLogger as _getLogger, DEBUG as _DEBUG
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 
 # Module imports
-from . import common as _common, _EXIT_MSG
+from . import common as _common
 
 _LOG = _getLogger(__name__)
 
 
-def _apply_fix_variant_alleles(row: _pd.Series) -> _pd.Series | None:
+def _get_score_alleles(df_vmap: _pd.DataFrame) -> _np.ndarray:
     """For each variant in the mapping data, determine the final score allele.
 
     Args:
-        - row (pandas.Series) : Row from the mapping DataFrame with the 
-        required variant details.
+        - df_vmap (pandas.DataFrame) : Mapping DataFrame with the required 
+        variant details (A1_map, A1_freq and A2 columns).
 
     Returns:
-        pandas.Series | None : Row containing the final score allele for that variant.
+        numpy.ndarray : Final score allele per variant (None if it could not be determined).
     """
-    if _pd.isna(row["A1_freq"]) or row["A1_map"] in [row["A1_freq"], row["A2"]]:
-        return row["A1_map"]
-    # score allele is shorter indel sequence but there is no data for longer one
-    elif row["A1_map"] == "-" and row["A1_freq"] == "0" and len(row["A2"]) == 1:
+    a1_map, a1_freq, a2 = df_vmap["A1_map"], df_vmap["A1_freq"], df_vmap["A2"]
+    len_a1_map, len_a1_freq, len_a2 = a1_map.str.len(), a1_freq.str.len(), a2.str.len()
+    # Conditions are evaluated in order, the first one met determines the score allele
+    conditions = [
+        a1_freq.isna() | (a1_map == a1_freq) | (a1_map == a2),
+        # score allele is shorter indel sequence but there is no data for longer one
+        (a1_map == "-") & (a1_freq == "0") & (len_a2 == 1),
+        # score allele is longer indel sequence and corresponds to F2
+        (len_a2 > len_a1_map) & (len_a1_map > 1),
+        # score allele is longer indel sequence and corresponds to F1
+        (len_a1_map > 1) & (len_a2 == 1),
+        # other standard missing allele cases
+        (a1_map != "-") & (a1_freq == "0"),
+        # other standard missing allele cases
+        (a1_map == "-") & (a1_freq != "0"),
+        # remaining cases - score allele is shorter indel sequence and corresponds to F1
+        # score allele is missing - since can never score leave as "-"
+        (a1_map == "-") & (a1_freq == "0"),
+    ]
+    choices = [
+        a1_map,
         # score allele must be F2
-        return row["A2"]
-    # score allele is longer indel sequence and corresponds to F2
-    elif len(row["A2"]) > len(row["A1_map"]) > 1:
+        a2,
         # score allele must be F2 whether have F1 or not
-        return row["A2"]
-    # score allele is longer indel sequence and corresponds to F1
-    elif len(row["A1_map"]) > 1 and len(row["A2"]) == 1:
-        if row["A2"] == "-":
-            return row["A1_map"]
-        elif row["A1_freq"] == "0":
-            return row["A2"] + row["A1_map"]
-        else:
-            return row["A1_freq"]
-    # other standard missing allele cases
-    elif row["A1_map"] != "-" and row["A1_freq"] == "0":
-        return row["A1_map"]
-    # other standard missing allele cases
-    elif row["A1_map"] == "-" and row["A1_freq"] != "0":
+        a2,
+        _np.where(
+            a2 == "-", a1_map, _np.where(a1_freq == "0", a2 + a1_map, a1_freq)
+        ),
+        a1_map,
         # score allele must be shorter of F1 and F2
-        return min(row["A1_freq"], row["A2"], key=len)
-    # remaining cases - score allele is shorter indel sequence and corresponds to F1
-    # score allele is missing - since can never score leave as "-"
-    elif row["A1_map"] == "-" and row["A1_freq"] == "0":
-        return row["A1_map"]
-    else:
-        return None
+        _np.where(len_a1_freq <= len_a2, a1_freq, a2),
+        a1_map,
+    ]
+    return _np.select(conditions, choices, default=None)
 
 
-def _apply_get_geno_call_alleles(row: _pd.Series, max_calls: int) -> list[str]:
+def _get_geno_call_codes(counts: _np.ndarray, max_calls: int) -> _np.ndarray:
     """For each DQ allele genotype count per individual, calculate the 
-    first N rank-ordered DQ allele names (with or without repetition).
+    positions of the first N rank-ordered DQ alleles (with or without repetition).
 
     Args:
-        - row (pandas.Series) : Row from the dosage DataFrame, with the 
-        rank-ordered DQ alleles as column names and the genotype counts as values.
+        - counts (numpy.ndarray) : Genotype counts from the dosage data, with 
+        one row per individual and one column per rank-ordered DQ allele.
         - max_calls (int) : Maximum number of DQ allele calls considered 
         per individual (excess calls are truncated).
 
     Returns:
-        list[str] : List with the first N DQ allele names per individual 
-        (right-padded with 'X' for empty calls), where 2 <= N <= max_calls.
+        numpy.ndarray : Array with the column positions of the first max_calls 
+        DQ alleles per individual (right-padded with the number of columns 
+        for empty calls).
     """
-    data = row.loc[row > 0]
-    data_serialise = [
-        [allele] * freq for allele, freq in dict(zip(data.index, data.values)).items()
-    ]
-    data_serialise_flat = [item for sublist in data_serialise for item in sublist]
-    data_serialise_flat_fill = sum([data_serialise_flat, ["X"] * max_calls], [])[
-        :max_calls
-    ]
-    return data_serialise_flat_fill
+    n_alleles = counts.shape[1]
+    cum_counts = counts.cumsum(axis=1)
+    codes = _np.empty((counts.shape[0], max_calls), dtype=_np.intp)
+    for k in range(max_calls):
+        # Call k+1 is the first allele at which the cumulative count exceeds k,
+        # or n_alleles if the individual has fewer than k+1 calls
+        reached = cum_counts > k
+        codes[:, k] = _np.where(reached[:, -1], reached.argmax(axis=1), n_alleles)
+    return codes
 
 
 def fix_variant_alleles(
@@ -114,36 +117,41 @@ def fix_variant_alleles(
     Returns:
         pandas.DataFrame : Contains the combination of both mapping and frequency data.
     """
-    _LOG.debug(
-        f"Executing: fix_variant_alleles("
-        + f"rdqfile='{rdqfile}', "
-        + f"bfile='{bfile}', "
-        + f"ofile='{ofile}', "
-        + f"mfile='{mfile}')"
-    )
+    if _LOG.isEnabledFor(_DEBUG):
+        _LOG.debug(
+            f"Executing: fix_variant_alleles("
+            + f"rdqfile='{rdqfile}', "
+            + f"bfile='{bfile}', "
+            + f"ofile='{ofile}', "
+            + f"mfile='{mfile}')"
+        )
     _LOG.info("Generating PLINK frequency report")
     ofile_dir: str = _os.path.dirname(ofile)
     ofile_name: str = _os.path.basename(ofile)
     temp_path: str = f"{ofile_dir}/temp_{ofile_name}"
-    command = f"plink --bfile '{bfile}' --freq --out '{temp_path}'"
-    _: str = _common.run_shell_cmd(cmd=command)  # return value not used here
-    df_rdq: _pd.DataFrame = _common.read_dataframe(
-        rdqfile, sep="\t", usecols=["DQ", "RANK"]
-    )
-    df_freq: _pd.DataFrame = _common.read_dataframe(
-        f"{temp_path}.frq", sep="\\s+",
-        usecols=["CHR", "SNP", "A1", "A2", "MAF", "NCHROBS"]
-    )
+    command: list[str] = ["plink", "--bfile", bfile, "--freq", "--out", temp_path]
+    # The configuration files are read in the background while PLINK runs
+    with _ThreadPoolExecutor(max_workers=2) as executor:
+        future_rdq = executor.submit(
+            _common.read_dataframe, rdqfile, sep="\t", usecols=["DQ", "RANK"]
+        )
+        future_map = executor.submit(
+            _common.read_dataframe, mfile, sep="\t", usecols=["ALLELE", "SNP", "A1"]
+        )
+        _: str = _common.run_shell_cmd(cmd=command)  # return value not used here
+        df_freq: _pd.DataFrame = _common.read_dataframe(
+            f"{temp_path}.frq", sep="\\s+",
+            usecols=["CHR", "SNP", "A1", "A2", "MAF", "NCHROBS"]
+        )
+        df_rdq: _pd.DataFrame = future_rdq.result()
+        df_map: _pd.DataFrame = future_map.result()
     df_freq.attrs["name"] = "PLINK --freq output"
-    _LOG.info("Combining mapping file data with frequency report data")
-    df_map: _pd.DataFrame = _common.read_dataframe(
-        mfile, sep="\t", usecols=["ALLELE", "SNP", "A1"]
-    )
     df_map.attrs["name"] = "Mapping file containing score allele"
+    _LOG.info("Combining mapping file data with frequency report data")
     df_vmap: _pd.DataFrame = df_map.merge(
         df_freq, how="left", on="SNP", suffixes=("_map", "_freq")
     )
-    df_vmap["A1"] = df_vmap.apply(_apply_fix_variant_alleles, axis=1)
+    df_vmap["A1"] = _get_score_alleles(df_vmap)
     _LOG.info("Sorting mapped variants by DQ rank order")
     df_vmap = (
         df_vmap.merge(df_rdq, how="left", left_on="ALLELE", right_on="DQ")
@@ -167,94 +175,83 @@ def create_dosage_table(
     Returns:
         pandas.DataFrame : Contains the per individual allelic dosage values.
     """
-    _LOG.debug(
-        f"Executing: create_dosage_table("
-            + f"""df_vmap='{df_vmap.attrs["name"]}', """
-            + f"""bfile='{bfile}', ofile='{ofile}')"""
-    )
+    if _LOG.isEnabledFor(_DEBUG):
+        _LOG.debug(
+            f"Executing: create_dosage_table("
+                + f"""df_vmap='{df_vmap.attrs.get("name")}', """
+                + f"""bfile='{bfile}', ofile='{ofile}')"""
+        )
     _LOG.info("Creating dosage table based on data from mapping & frequency report")
     ofile_dir: str = _os.path.dirname(ofile)
     ofile_name: str = _os.path.basename(ofile)
     temp_path: str = f"{ofile_dir}/temp_{ofile_name}"
-    df_scores: _pd.DataFrame = df_vmap[["SNP", "A1"]].copy(deep=True)
-    df_scores["VAL"] = 1
-    df_rngqty: _pd.DataFrame = df_vmap[["SNP", "RANK"]].copy(deep=True)
-    df_rngbound: _pd.DataFrame = df_rngqty.copy(deep=True)
-    df_rngbound["LOW"], df_rngbound["HIGH"] = (
-        df_rngbound["RANK"] - 0.5,
-        df_rngbound["RANK"] + 0.5,
+    # Column selections are only written out, so they are not copied
+    df_scores: _pd.DataFrame = df_vmap[["SNP", "A1"]].assign(VAL=1)
+    df_rngqty: _pd.DataFrame = df_vmap[["SNP", "RANK"]]
+    df_rngbound: _pd.DataFrame = df_vmap[["SNP"]].assign(
+        LOW=df_vmap["RANK"] - 0.5, HIGH=df_vmap["RANK"] + 0.5
     )
-    df_rngbound.drop(columns=["RANK"], inplace=True)
-    try:
-        df_scores.to_csv(
-            f"{temp_path}.scores", sep="\t", index=False, header=False, encoding="UTF-8"
-        )
-        df_rngqty.to_csv(
-            f"{temp_path}.rngqty", sep="\t", index=False, header=False, encoding="UTF-8"
-        )
-        df_rngbound.to_csv(
-            f"{temp_path}.rngbound",
-            sep="\t",
-            index=False,
-            header=False,
-            encoding="UTF-8",
-        )
-    except Exception as e:
-        _LOG.exception(e)
-        _LOG.error(_EXIT_MSG)
-        _exit(1)
-    command: str = (
-        f"plink --bfile '{bfile}' --score '{temp_path}.scores' no-mean-imputation "
-        + f"--q-score-range '{temp_path}.rngbound' '{temp_path}.rngqty' --out '{temp_path}'"
+    _common.write_dataframe(df_scores, f"{temp_path}.scores", sep="\t", header=False)
+    _common.write_dataframe(df_rngqty, f"{temp_path}.rngqty", sep="\t", header=False)
+    _common.write_dataframe(
+        df_rngbound, f"{temp_path}.rngbound", sep="\t", header=False
     )
+    command: list[str] = [
+        "plink", "--bfile", bfile,
+        "--score", f"{temp_path}.scores", "no-mean-imputation",
+        "--q-score-range", f"{temp_path}.rngbound", f"{temp_path}.rngqty",
+        "--out", temp_path,
+    ]
     _: str = _common.run_shell_cmd(cmd=command)  # return value not used here
-    qscore_file_rgx: _re.Pattern[str] = _re.compile(f"{temp_path}\\.(\\S+)\\.profile$")
+    # PLINK writes one '<temp_path>.<SNP>.profile' file per --q-score-range SNP
+    snp_to_allele: dict[str, str] = dict(
+        zip(df_vmap["SNP"].to_numpy(), df_vmap["ALLELE"].to_numpy())
+    )
+    prefix_len, suffix_len = len(temp_path) + 1, len(".profile")
     qscore_alleles_map: dict[str, str] = {}
-    for r, _, fs in _os.walk(ofile_dir):
-        for f in fs:
-            qscore_file: str = _os.path.join(r, f)
-            m: _re.Match[str] | None = _re.search(qscore_file_rgx, qscore_file)
-            if m is not None:
-                qscore_alleles_map[
-                    df_vmap.loc[df_vmap["SNP"] == m.group(1), "ALLELE"].item()
-                ] = qscore_file
+    # The prefix is escaped, so that glob metacharacters in the output path match literally
+    for qscore_file in _glob.iglob(f"{_glob.escape(temp_path)}.*.profile"):
+        qscore_snp: str = qscore_file[prefix_len:-suffix_len]
+        qscore_alleles_map[snp_to_allele[qscore_snp]] = qscore_file
     _LOG.info(
         "Concatenating range score profiles for each mapping DQ allele "
             + "into a single table"
     )
-    df_dosage: _pd.DataFrame = None
+    # Profiles share the same individuals, so they are aligned on a (FID, IID) index
+    # and concatenated once, instead of merging them one by one
+    dosage_series: list[_pd.Series] = []
     for qscore_allele, qscore_file in qscore_alleles_map.items():
-        if df_dosage is None:
-            df_dosage: _pd.DataFrame = _common.read_dataframe(
-                qscore_file,
-                sep="\\s+",
-                usecols=["FID", "IID", "SCORE"],
-                dtype={"FID": str, "IID": str}
-            )
-            df_dosage.rename(columns={"SCORE": qscore_allele}, inplace=True)
-        else:
-            df_dosage_temp: _pd.DataFrame = _common.read_dataframe(
-                qscore_file,
-                sep="\\s+",
-                usecols=["FID", "IID", "SCORE"],
-                dtype={"FID": str, "IID": str}
-            )
-            df_dosage_temp.rename(columns={"SCORE": qscore_allele}, inplace=True)
-            df_dosage = df_dosage.merge(
-                df_dosage_temp, how="outer", on=["FID", "IID"]
-            )
-            del df_dosage_temp
+        df_dosage_temp: _pd.DataFrame = _common.read_dataframe(
+            qscore_file,
+            sep="\\s+",
+            usecols=["FID", "IID", "SCORE"],
+            dtype={"FID": str, "IID": str}
+        )
+        dosage_series.append(
+            df_dosage_temp.set_index(["FID", "IID"])["SCORE"].rename(qscore_allele)
+        )
+    df_dosage: _pd.DataFrame = _pd.concat(dosage_series, axis=1).reset_index()
     vmap_alleles: list[str] = df_vmap["ALLELE"].to_list()
     qscore_alleles: list[str] = list(qscore_alleles_map.keys())
     # Get elements present in vmap_alleles but not in qscore_alleles, 
-    # i.e., list(vmap_alleles) - list(qscore_alleles)
-    no_qscore_alleles: list[str] = list(
-        set(vmap_alleles).difference(set(qscore_alleles))
+    # i.e., list(vmap_alleles) - list(qscore_alleles), keeping the rank order
+    no_qscore_alleles: list[str] = (
+        _pd.Index(vmap_alleles).difference(qscore_alleles, sort=False).to_list()
     )
     _LOG.info("Converting dosage data to genotype data")
-    df_dosage[no_qscore_alleles] = 0.0
+    # Zero dosage columns are added as a single block, rather than one column at a time
+    df_no_qscore: _pd.DataFrame = _pd.DataFrame(
+        _np.zeros((len(df_dosage), len(no_qscore_alleles)), dtype=_np.float64),
+        columns=no_qscore_alleles,
+        index=df_dosage.index,
+    )
+    df_dosage = _pd.concat([df_dosage, df_no_qscore], axis=1)
     df_dosage = df_dosage[["FID", "IID"] + vmap_alleles]
-    df_dosage[vmap_alleles] = _rint(df_dosage[vmap_alleles] * 2).astype(_UBYTE)
+    # Genotype count = dosage * 2, rounded to the nearest integer, computed in-place
+    dosages: _np.ndarray = df_dosage[vmap_alleles].to_numpy(dtype=_np.float64)
+    _np.multiply(dosages, 2.0, out=dosages)
+    _np.rint(dosages, out=dosages)
+    df_dosage[vmap_alleles] = dosages.astype(_np.ubyte)
     _common.delete_files_within(dirpath=ofile_dir, pattern=temp_path)
     return df_dosage
 
@@ -277,19 +274,22 @@ def get_geno_call_alleles(
         (with or without repetition).
     """
     max_calls = 2
-    _LOG.debug(
-        "Executing: get_geno_call_alleles(" + \
-        f"""df_dsg='{df_dsg.attrs["name"]}', """ + \
-        f"""alleles={alleles}, max_calls={max_calls})"""
-    )
+    if _LOG.isEnabledFor(_DEBUG):
+        _LOG.debug(
+            "Executing: get_geno_call_alleles(" + \
+            f"""df_dsg='{df_dsg.attrs.get("name")}', """ + \
+            f"""alleles={alleles}, max_calls={max_calls})"""
+        )
     _LOG.info("Retrieving genotype calls for mapping alleles")
-    df_geno: _pd.DataFrame = df_dsg[["FID", "IID"]].copy(deep=True)
     # max_calls = df_dsg[alleles].max(axis=0).max()
-    df_geno["CALLS"] = df_dsg[alleles].apply(
-        _apply_get_geno_call_alleles, max_calls=max_calls, axis=1
-    )
-    df_geno[["GENO1", "GENO2"]] = _pd.DataFrame(
-        df_geno["CALLS"].tolist(), index=df_geno.index
+    # Calls are categorical, with 'X' as the trailing category for empty calls
+    call_dtype = _pd.CategoricalDtype(alleles + ["X"])
+    call_codes = _get_geno_call_codes(df_dsg[alleles].to_numpy(), max_calls=max_calls)
+    df_geno: _pd.DataFrame = df_dsg[["FID", "IID"]].assign(
+        **{
+            f"GENO{k + 1}": _pd.Categorical.from_codes(call_codes[:, k], dtype=call_dtype)
+            for k in range(max_calls)
+        }
     )
     return df_geno
 
@@ -322,34 +322,56 @@ def generate_grs(
     Returns:
         pandas.DataFrame : Contains the per individual T1DGRS2 values.
     """
-    _LOG.debug(
-        "Executing: generate_grs("
-            + f"""df_geno='{df_geno.attrs["name"]}', """
-            + f"""bfile='{bfile}', """
-            + f"""ofile='{ofile}', """
-            + f"""rdqfile='{rdqfile}', """
-            + f"""sc_int='{sc_int}', """
-            + f"""sc_plink_all='{sc_plink_all}', """
-            + f"""sc_plink_hla='{sc_plink_hla}')"""
-    )
+    if _LOG.isEnabledFor(_DEBUG):
+        _LOG.debug(
+            "Executing: generate_grs("
+                + f"""df_geno='{df_geno.attrs.get("name")}', """
+                + f"""bfile='{bfile}', """
+                + f"""ofile='{ofile}', """
+                + f"""rdqfile='{rdqfile}', """
+                + f"""sc_int='{sc_int}', """
+                + f"""sc_plink_all='{sc_plink_all}', """
+                + f"""sc_plink_hla='{sc_plink_hla}')"""
+        )
     ofile_dir: str = _os.path.dirname(ofile)
     ofile_name: str = _os.path.basename(ofile)
     temp_path: str = f"{ofile_dir}/temp_{ofile_name}"
-    df_rdq: _pd.DataFrame = _common.read_dataframe(
-        rdqfile, sep="\t", usecols=["DQ", "RANK"]
-    )
-    df_sc_int: _pd.DataFrame = _common.read_dataframe(
-        sc_int, sep="\t", usecols=["ALLELE1", "ALLELE2", "BETA"]
-    )
+    # The scoring files are independent of each other, so they are read concurrently.
+    # The PLINK score files are only read to validate their columns before running PLINK
+    with _ThreadPoolExecutor(max_workers=4) as executor:
+        future_rdq = executor.submit(
+            _common.read_dataframe, rdqfile, sep="\t", usecols=["DQ", "RANK"]
+        )
+        future_sc_int = executor.submit(
+            _common.read_dataframe,
+            sc_int,
+            sep="\t",
+            usecols=["ALLELE1", "ALLELE2", "BETA"],
+        )
+        future_sc_plink_all = executor.submit(
+            _common.read_dataframe,
+            sc_plink_all,
+            sep="\t",
+            usecols=["ID", "ALLELE", "BETA"],
+        )
+        future_sc_plink_hla = (
+            executor.submit(
+                _common.read_dataframe,
+                sc_plink_hla,
+                sep="\t",
+                usecols=["ID", "ALLELE", "BETA"],
+            )
+            if sc_plink_hla != ""
+            else None
+        )
+        df_rdq: _pd.DataFrame = future_rdq.result()
+        df_sc_int: _pd.DataFrame = future_sc_int.result()
+        df_sc_plink_all: _pd.DataFrame = future_sc_plink_all.result()
+        if future_sc_plink_hla is not None:
+            df_sc_plink_hla: _pd.DataFrame = future_sc_plink_hla.result()
+            df_sc_plink_hla.attrs["name"] = "Mapped DQ allele variants PLINK scores"
     df_sc_int.attrs["name"] = "Mapped DQ allele variants interaction scores"
-    df_sc_plink_all: _pd.DataFrame = _common.read_dataframe(
-        sc_plink_all, sep="\t", usecols=["ID", "ALLELE", "BETA"]
-    )
     df_sc_plink_all.attrs["name"] = "All variants PLINK scores"
-    df_sc_plink_hla: _pd.DataFrame = _common.read_dataframe(
-        sc_plink_hla, sep="\t", usecols=["ID", "ALLELE", "BETA"]
-    )
-    df_sc_plink_hla.attrs["name"] = "Mapped DQ allele variants PLINK scores"
     _LOG.info("Retrieving scores for interacting DQ alleles")
     allele_cols = sorted(
         df_sc_int.columns[df_sc_int.columns.str.startswith("ALLELE")].to_list()
@@ -357,49 +379,46 @@ def generate_grs(
     geno_cols = sorted(
         df_geno.columns[df_geno.columns.str.startswith("GENO")].to_list()
     )
-    # Operations to rank-order DQ allele interations from the interactions score file
-    df_sc_int["SNO"] = _arange(
-        start=1, stop=len(df_sc_int.index) + 1, step=1, dtype=int
-    )
-    df_sc_int_long = df_sc_int.melt(
-        id_vars=["SNO"], value_vars=allele_cols
-    ).reset_index(drop=True)
-    df_sc_int_long = (
-        df_sc_int_long.merge(df_rdq, how="left", left_on="value", right_on="DQ")
-        .sort_values(by=["SNO", "RANK"])
-        .reset_index(drop=True)
-    )
-    df_sc_int_long["ALLELE_ORDER"] = (
-        df_sc_int_long.groupby(by=["SNO"])["RANK"]
-        .transform("rank", method="first")
-        .astype(int)
-    )
-    df_sc_int_long["ALLELE_ORDER"] = \
-        "ALLELE" + df_sc_int_long["ALLELE_ORDER"].astype(str)
-    df_sc_int_mod = df_sc_int_long.pivot(
-        index=["SNO"], columns=["ALLELE_ORDER"], values=["value"]
-    ).reset_index()
-    df_sc_int_mod.columns = df_sc_int_mod.columns.droplevel(0)
-    df_sc_int_mod.columns.name = None
-    df_sc_int_mod.rename(columns={"": "SNO"}, inplace=True)
-    df_sc_int = (
-        df_sc_int_mod.merge(df_sc_int[["SNO", "BETA"]], how="inner", on="SNO")
-        .drop(columns=["SNO"])
-        .reset_index(drop=True)
+    # Rank-order the DQ alleles of each interaction from the interactions score file,
+    # to match the rank order of the genotype calls
+    rank_map: _pd.Series = df_rdq.set_index("DQ")["RANK"]
+    ranks = _np.column_stack(
+        [df_sc_int[col].map(rank_map).to_numpy(dtype=_np.float64) for col in allele_cols]
     )
-    del df_sc_int_long, df_sc_int_mod
-    df_scores: _pd.DataFrame = (
-        df_geno[["FID", "IID"] + geno_cols]
-        .merge(df_sc_int, how="left", left_on=geno_cols, right_on=allele_cols)
-        .drop(columns=geno_cols + allele_cols)
-        .fillna({"BETA": 0})
-        .reset_index(drop=True)
+    df_sc_int[allele_cols] = _np.take_along_axis(
+        df_sc_int[allele_cols].to_numpy(),
+        _np.argsort(ranks, axis=1, kind="stable"),
+        axis=1,
     )
+    # Interaction BETA per pair of genotype calls, 0 for pairs without an interaction score.
+    # BETAs are looked up once per distinct pair, then broadcast back to the individuals
+    beta_lookup: _pd.Series = df_sc_int.set_index(allele_cols)["BETA"]
+    pair_codes, geno_pairs = _pd.MultiIndex.from_frame(df_geno[geno_cols]).factorize()
+    pair_betas = beta_lookup.reindex(geno_pairs).fillna(0).to_numpy()
+    df_scores: _pd.DataFrame = df_geno[["FID", "IID"]].reset_index(drop=True)
+    df_scores["BETA"] = pair_betas[pair_codes]
+    commands: list[list[str]] = [
+        [
+            "plink", "--bfile", bfile,
+            "--score", sc_plink_all, "header", "sum",
+            "--out", temp_path,
+        ]
+    ]
+    if sc_plink_hla != "":
+        commands.append(
+            [
+                "plink", "--bfile", bfile,
+                "--score", sc_plink_hla, "header", "sum",
+                "--out", f"{temp_path}_dq",
+            ]
+        )
+    _LOG.info("Generating PLINK score profiles")
+    # The PLINK --score runs write to different --out prefixes and do not depend
+    # on each other, so they are run concurrently
+    with _ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        for _ in executor.map(_common.run_shell_cmd, commands):
+            pass  # return values not used here, iterated to raise any errors
     _LOG.info("Computing SCORE based on interaction terms & weights for all variants")
-    command: str = (
-        f"plink --bfile '{bfile}' --score '{sc_plink_all}' 'header' sum --out '{temp_path}'"
-    )
-    _common.run_shell_cmd(cmd=command)
     df_sc_plink_calc = _common.read_dataframe(
         f"{temp_path}.profile",
         sep="\\s+",
@@ -410,16 +429,13 @@ def generate_grs(
     df_scores = df_scores.merge(
         df_sc_plink_calc, how="inner", on=["FID", "IID"]
     ).reset_index(drop=True)
-    df_scores["SCORE"] = df_scores[["BETA", "SCORESUM_plink"]].sum(axis=1)
+    df_scores["SCORE"] = (
+        df_scores["BETA"].to_numpy() + df_scores["SCORESUM_plink"].to_numpy()
+    )
     if sc_plink_hla != "":
         _LOG.info(
             "Computing DQSCORE based on interaction terms & weights for DQ allele variants"
         )
-        command: str = (
-            f"plink --bfile '{bfile}' --score '{sc_plink_hla}' 'header' "
-                + f"sum --out '{temp_path}_dq'"
-        )
-        _common.run_shell_cmd(cmd=command)
         df_sc_dq_plink_calc = _common.read_dataframe(
             f"{temp_path}_dq.profile",
             sep="\\s+",
@@ -434,7 +450,9 @@ def generate_grs(
             how="inner",
             on=["FID", "IID"],
         ).reset_index(drop=True)
-        df_scores["DQSCORE"] = df_scores[["BETA", "SCORESUM_dq_plink"]].sum(axis=1)
+        df_scores["DQSCORE"] = (
+            df_scores["BETA"].to_numpy() + df_scores["SCORESUM_dq_plink"].to_numpy()
+        )
     score_cols_to_drop = sum(
         [["BETA"], [col for col in df_scores.columns if col.startswith("SCORESUM")]], []
     )
@@ -0,0 +1,10 @@
+import os
+import pytest
+from uuid import uuid4
+
+
+@pytest.fixture
+def temp_directory(tmp_path) -> str:
+    curr_run = str(uuid4())
+    os.makedirs(os.path.join(tmp_path, curr_run), exist_ok=True)
+    return os.path.join(tmp_path, curr_run)
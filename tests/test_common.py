@@ -17,13 +17,6 @@ DATA = [
 ]
 
 
-@pytest.fixture
-def temp_directory(tmp_path) -> str:
-    curr_run = str(uuid4())
-    os.makedirs(os.path.join(tmp_path, curr_run), exist_ok=True)
-    return os.path.join(tmp_path, curr_run)
-
-
 def test_os_is_linux() -> None:
     """Test to check if OS is Linux-based."""
     assert platform.lower() == "linux", "Not a Linux-based platform"
@@ -35,6 +28,18 @@ def test_shell_working() -> None:
     assert len(shell_output) > 0, "Terminal shell not working"
 
 
+def test_shell_argv() -> None:
+    """Test to check if a shell command given as a list of arguments is run correctly."""
+    shell_output = common.run_shell_cmd(cmd=["echo", "two  spaces", "$HOME"])
+    assert shell_output == "two  spaces $HOME", "Arguments not passed as given"
+
+
+def test_shell_missing_executable() -> None:
+    """Test to check that a missing executable raises an OSError."""
+    with pytest.raises(OSError):
+        common.run_shell_cmd(cmd=[f"missing-{uuid4()}", "--version"])
+
+
 def test_plink_version() -> None:
     """Test to check that the version of PLINk installed is v1.90x."""
     shell_output = common.run_shell_cmd(cmd="plink --version")
@@ -56,6 +61,17 @@ def test_delete_files_within(temp_directory: str) -> None:
         os.stat(testfile)
 
 
+def test_delete_files_within_missing_directory(temp_directory: str) -> None:
+    """Test to check that recursive file deletion skips a missing directory.
+
+    Args:
+        - temp_directory (str): Temporary directory created by pytest.
+    """
+    missing_directory = os.path.join(temp_directory, "MISSING")
+    common.delete_files_within(dirpath=missing_directory, pattern="TESTFILE")
+    assert not os.path.exists(missing_directory)
+
+
 def test_read_dataframe(temp_directory: str) -> None:
     """Test to check if a text-based file was read correctly into a pandas.DataFrame.
 
@@ -118,3 +134,52 @@ def test_read_dataframe(temp_directory: str) -> None:
             "COL5": [1, 0, 1],
         })
     )
+
+
+@pytest.mark.parametrize("has_pyarrow", [True, False])
+def test_write_dataframe(
+    temp_directory: str, monkeypatch: pytest.MonkeyPatch, has_pyarrow: bool
+) -> None:
+    """Test to check if a pandas.DataFrame was written correctly to a text-based file,
+    with both the pyarrow writer and the pandas fallback.
+
+    Args:
+        - temp_directory (str): Temporary directory created by pytest.
+        - monkeypatch (pytest.MonkeyPatch): Used to disable the pyarrow writer.
+        - has_pyarrow (bool): Whether the pyarrow writer is used.
+    """
+    if has_pyarrow:
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(common, "_HAS_PYARROW", has_pyarrow)
+    df = pd.DataFrame({
+        "COL1": ["aa", "bb"],
+        "COL2": [1.0, 1e-05],
+        "COL3": [float("nan"), 2.5],
+        "COL4": [True, False],
+        "COL5": [1, 2],
+    })
+    tabsep_file = os.path.join(temp_directory, "write_df_tabsep.tsv")
+    common.write_dataframe(df, tabsep_file, sep="\t")
+    with open(tabsep_file, mode="r", encoding="UTF-8") as fp:
+        lines = fp.read().splitlines()
+    # Case 1: header line is not quoted
+    assert lines[0] == "COL1\tCOL2\tCOL3\tCOL4\tCOL5"
+    # Case 2: missing values are written as empty fields. The text representation of
+    # floats and booleans differs between the pyarrow writer and pandas, which is visible
+    # in the *_RESULTS.tsv, *_dosage.tsv & *_DQ_calls.tsv outputs: with pyarrow installed,
+    # 1.0 is written as 1, 1e-05 as 0.00001 and True as true
+    if has_pyarrow:
+        assert lines[1:] == ["aa\t1\t\ttrue\t1", "bb\t0.00001\t2.5\tfalse\t2"]
+    else:
+        assert lines[1:] == ["aa\t1.0\t\tTrue\t1", "bb\t1e-05\t2.5\tFalse\t2"]
+    # Case 3: reading the written data back gives the same values
+    assert_frame_equal(
+        common.read_dataframe(
+            tabsep_file, sep="\t", usecols=["COL1", "COL2", "COL3", "COL4", "COL5"]
+        ),
+        df,
+    )
+    # Case 4: writing without the header line
+    common.write_dataframe(df, tabsep_file, sep="\t", header=False)
+    with open(tabsep_file, mode="r", encoding="UTF-8") as fp:
+        assert fp.readline().startswith("aa\t")
@@ -0,0 +1,74 @@
+import os
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from t1dgrs2 import metrics
+
+
+# ROC thresholds are deliberately not in ascending order
+ROC_DATA = [
+    ["threshold", "CtrlPCentile", "CasePCentile", "PPV"],
+    [2.0, 20.0, 2.0, 0.2],
+    [1.0, 10.0, 1.0, 0.1],
+    [4.0, 40.0, 4.0, 0.4],
+]
+
+
+def test_retrieve_centiles(temp_directory: str) -> None:
+    """Test to check that each individual is assigned the values of the ROC threshold
+    nearest to their SCORE.
+
+    Args:
+        - temp_directory (str): Temporary directory created by pytest.
+    """
+    roc_file = os.path.join(temp_directory, "roc.tsv")
+    with open(roc_file, mode="w", encoding="UTF-8") as fp:
+        for line in ROC_DATA:
+            fp.write("\t".join([str(x) for x in line]) + os.linesep)
+    df_scores = pd.DataFrame({
+        "FID": ["A", "B", "C", "D", "E", "F"],
+        "IID": ["A", "B", "C", "D", "E", "F"],
+        # Case 1: nearest by distance, on either side of a threshold (A, B)
+        # Case 2: equidistant from two thresholds, the lower one is used (C)
+        # Case 3: exact threshold match (D)
+        # Case 4: scores below/above the range take the first/last threshold (E, F)
+        "SCORE": [1.4, 1.6, 3.0, 4.0, -5.0, 10.0],
+        "DQSCORE": [0.0] * 6,
+    })
+    assert_frame_equal(
+        metrics.retrieve_centiles(df_scores=df_scores, rfile=roc_file),
+        pd.DataFrame({
+            "FID": ["A", "B", "C", "D", "E", "F"],
+            "IID": ["A", "B", "C", "D", "E", "F"],
+            "SCORE": [1.4, 1.6, 3.0, 4.0, -5.0, 10.0],
+            "DQSCORE": [0.0] * 6,
+            "CTRLCENTILE": [10.0, 20.0, 20.0, 40.0, 10.0, 40.0],
+            "CASECENTILE": [1.0, 2.0, 2.0, 4.0, 1.0, 4.0],
+            "PPV": [0.1, 0.2, 0.2, 0.4, 0.1, 0.4],
+        })
+    )
+
+
+def test_retrieve_centiles_without_dqscore(temp_directory: str) -> None:
+    """Test to check that centiles are retrieved for scores without a DQSCORE column,
+    i.e., when no DQ allele variants score file is configured.
+
+    Args:
+        - temp_directory (str): Temporary directory created by pytest.
+    """
+    roc_file = os.path.join(temp_directory, "roc.tsv")
+    with open(roc_file, mode="w", encoding="UTF-8") as fp:
+        for line in ROC_DATA:
+            fp.write("\t".join([str(x) for x in line]) + os.linesep)
+    df_scores = pd.DataFrame({"FID": ["A"], "IID": ["A"], "SCORE": [1.4]})
+    assert_frame_equal(
+        metrics.retrieve_centiles(df_scores=df_scores, rfile=roc_file),
+        pd.DataFrame({
+            "FID": ["A"],
+            "IID": ["A"],
+            "SCORE": [1.4],
+            "CTRLCENTILE": [10.0],
+            "CASECENTILE": [1.0],
+            "PPV": [0.1],
+        })
+    )
@@ -0,0 +1,156 @@
+import os
+import pytest
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from t1dgrs2 import score
+
+
+# One row per case, in the order the cases are evaluated:
+# A1_map, A1_freq, A2, expected score allele
+SCORE_ALLELE_CASES = [
+    # A1_freq missing (variant not in the --freq report), or A1_map matching A1_freq or A2
+    ["A", None, None, "A"],
+    ["A", "A", "G", "A"],
+    ["G", "A", "G", "G"],
+    # shorter indel sequence without data for the longer one
+    ["-", "0", "T", "T"],
+    # longer indel sequence corresponding to F2
+    ["AT", "C", "ATG", "ATG"],
+    # longer indel sequence corresponding to F1
+    ["AT", "A", "-", "AT"],
+    ["AT", "0", "G", "GAT"],
+    ["AT", "A", "G", "A"],
+    # other standard missing allele cases
+    ["A", "0", "G", "A"],
+    ["-", "AT", "G", "G"],
+    ["-", "A", "G", "A"],  # same length, F1 is used
+    # score allele missing
+    ["-", "0", "TT", "-"],
+    # no case met
+    ["A", "C", "G", None],
+]
+
+
+def test_get_score_alleles() -> None:
+    """Test to check that the score allele is determined correctly for each case."""
+    df_vmap = pd.DataFrame(
+        [row[:3] for row in SCORE_ALLELE_CASES], columns=["A1_map", "A1_freq", "A2"]
+    )
+    assert score._get_score_alleles(df_vmap).tolist() == [
+        row[3] for row in SCORE_ALLELE_CASES
+    ]
+
+
+# Genotype counts per rank-ordered DQ allele, expected calls
+GENO_CALL_CASES = [
+    [[0, 0, 0], ["X", "X"]],  # no calls
+    [[0, 1, 0], ["DQ2", "X"]],  # 1 call
+    [[1, 0, 1], ["DQ1", "DQ3"]],  # 2 calls
+    [[0, 2, 0], ["DQ2", "DQ2"]],  # 2 calls on the same allele
+    [[1, 1, 1], ["DQ1", "DQ2"]],  # excess calls are truncated
+]
+
+
+def test_get_geno_call_alleles() -> None:
+    """Test to check that the first 2 rank-ordered DQ allele calls are retrieved correctly
+    per individual, right-padded with 'X' for empty calls."""
+    alleles = ["DQ1", "DQ2", "DQ3"]
+    counts = [row[0] for row in GENO_CALL_CASES]
+    ids = [f"ID{i}" for i in range(len(GENO_CALL_CASES))]
+    df_dsg = pd.DataFrame(counts, columns=alleles, dtype="uint8")
+    df_dsg.insert(0, "FID", ids)
+    df_dsg.insert(1, "IID", ids)
+    # Call positions, with len(alleles) for empty calls
+    assert score._get_geno_call_codes(df_dsg[alleles].to_numpy(), max_calls=2).tolist() == [
+        [alleles.index(call) if call != "X" else len(alleles) for call in row[1]]
+        for row in GENO_CALL_CASES
+    ]
+    df_geno = score.get_geno_call_alleles(df_dsg=df_dsg, alleles=alleles)
+    assert df_geno.columns.to_list() == ["FID", "IID", "GENO1", "GENO2"]
+    assert df_geno["IID"].to_list() == ids
+    assert df_geno[["GENO1", "GENO2"]].astype(str).values.tolist() == [
+        row[1] for row in GENO_CALL_CASES
+    ]
+
+
+# Rank-ordered DQ alleles, interaction scores with pairs not given in rank order
+GRS_RANKS = [["DQ", "RANK"], ["DQ62", 1], ["DQ25", 2], ["DQ81", 3]]
+GRS_INTERACTIONS = [
+    ["ALLELE1", "ALLELE2", "BETA"],
+    ["DQ81", "DQ25", 0.5],  # reverse rank order
+    ["DQ81", "DQ81", -1.0],
+]
+# Genotype counts per rank-ordered DQ allele, expected interaction BETA
+GRS_CASES = [
+    [[0, 1, 1], 0.5],  # DQ25 & DQ81, matching the reverse rank order interaction
+    [[1, 1, 0], 0.0],  # DQ62 & DQ25, without an interaction score
+    [[0, 0, 1], 0.0],  # DQ81 & X padding call
+    [[0, 0, 2], -1.0],  # DQ81 & DQ81
+]
+
+
+def test_generate_grs(temp_directory: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test to check that the interaction BETAs are matched to the genotype calls
+    and added to the PLINK scores, using mocked PLINK --score runs.
+
+    Args:
+        - temp_directory (str): Temporary directory created by pytest.
+        - monkeypatch (pytest.MonkeyPatch): Used to mock the PLINK commands.
+    """
+    alleles = [row[0] for row in GRS_RANKS[1:]]
+    ids = [f"ID{i}" for i in range(len(GRS_CASES))]
+    plink_sums = {"": [1.0, 2.0, 3.0, 4.0], "_dq": [0.1, 0.2, 0.3, 0.4]}
+    files = {}
+    for name, data in [
+        ("rdq", GRS_RANKS),
+        ("sc_int", GRS_INTERACTIONS),
+        ("sc_plink_all", [["ID", "ALLELE", "BETA"], ["rs1", "A", 0.1]]),
+        ("sc_plink_hla", [["ID", "ALLELE", "BETA"], ["rs2", "G", 0.2]]),
+    ]:
+        files[name] = os.path.join(temp_directory, f"{name}.tsv")
+        with open(files[name], mode="w", encoding="UTF-8") as fp:
+            for line in data:
+                fp.write("\t".join([str(x) for x in line]) + os.linesep)
+    ofile = os.path.join(temp_directory, "output")
+    temp_path = os.path.join(temp_directory, "temp_output")
+
+    def run_plink_score(cmd: list[str]) -> str:
+        # Profiles are written in reverse order, to check that they are matched on FID/IID
+        out = cmd[cmd.index("--out") + 1]
+        with open(f"{out}.profile", mode="w", encoding="UTF-8") as fp:
+            fp.write("   FID   IID  PHENO    CNT   CNT2    SCORESUM\n")
+            for iid, scoresum in reversed(
+                list(zip(ids, plink_sums[out[len(temp_path):]]))
+            ):
+                fp.write(f"{iid:>6} {iid:>5} {-9:>6} {2:>6} {2:>6} {scoresum:>11}\n")
+        return ""
+
+    monkeypatch.setattr(score._common, "run_shell_cmd", run_plink_score)
+    df_dsg = pd.DataFrame([row[0] for row in GRS_CASES], columns=alleles, dtype="uint8")
+    df_dsg.insert(0, "FID", ids)
+    df_dsg.insert(1, "IID", ids)
+    df_geno = score.get_geno_call_alleles(df_dsg=df_dsg, alleles=alleles)
+    assert df_geno[["GENO1", "GENO2"]].astype(str).values.tolist() == [
+        ["DQ25", "DQ81"], ["DQ62", "DQ25"], ["DQ81", "X"], ["DQ81", "DQ81"]
+    ]
+    betas = [row[1] for row in GRS_CASES]
+    assert_frame_equal(
+        score.generate_grs(
+            df_geno=df_geno,
+            bfile="bfile",
+            ofile=ofile,
+            rdqfile=files["rdq"],
+            sc_int=files["sc_int"],
+            sc_plink_all=files["sc_plink_all"],
+            sc_plink_hla=files["sc_plink_hla"],
+        ),
+        pd.DataFrame({
+            "FID": ids,
+            "IID": ids,
+            "SCORE": [b + s for b, s in zip(betas, plink_sums[""])],
+            "DQSCORE": [b + s for b, s in zip(betas, plink_sums["_dq"])],
+        })
+    )
+    # PLINK temporary files are deleted
+    assert not any(f.startswith("temp_output") for f in os.listdir(temp_directory))
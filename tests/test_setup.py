@@ -0,0 +1,34 @@
+import os
+import json
+import pytest
+from importlib.util import module_from_spec, spec_from_file_location
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+@pytest.fixture
+def setup_module(monkeypatch: pytest.MonkeyPatch):
+    # Only tests/ is shipped to the conda recipe test phase, without setup.py or the recipe
+    for required_file in ["setup.py", "conda.recipe/meta.yaml"]:
+        if not os.path.isfile(os.path.join(_ROOT_DIR, required_file)):
+            pytest.skip(f"'{required_file}' not found next to tests/")
+    # setup.py uses paths relative to the repository root, and imports versioneer from it
+    monkeypatch.chdir(_ROOT_DIR)
+    monkeypatch.syspath_prepend(_ROOT_DIR)
+    spec = spec_from_file_location("setup", os.path.join(_ROOT_DIR, "setup.py"))
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_conda_meta_json_in_sync(setup_module) -> None:
+    """Test to check that conda.recipe/meta.json matches conda.recipe/meta.yaml.
+
+    Args:
+        - setup_module (module): setup.py loaded as a module.
+    """
+    with open(setup_module.CONDA_META_JSON_FILE, mode="r", encoding="UTF-8") as fp:
+        conda_metadata_json = json.load(fp)
+    assert conda_metadata_json == setup_module.get_conda_metadata(
+        setup_module.CONDA_META_FILE
+    ), "conda.recipe/meta.json is stale, run tools/refresh_meta_json.py"
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+
+"""Regenerate conda.recipe/meta.json from conda.recipe/meta.yaml.
+
+setup.py reads the package metadata from this JSON file instead of parsing
+the conda recipe, whenever the JSON file exists. Run this script after every
+change to conda.recipe/meta.yaml and commit the result, otherwise
+tests/test_setup.py fails:
+
+    python tools/refresh_meta_json.py
+"""
+
+import os
+import sys
+import json
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+if __name__ == "__main__":
+    os.chdir(_ROOT_DIR)
+    sys.path.insert(0, _ROOT_DIR)
+    from setup import CONDA_META_FILE, CONDA_META_JSON_FILE, get_conda_metadata
+
+    with open(CONDA_META_JSON_FILE, mode="w", encoding="UTF-8") as fp:
+        json.dump(get_conda_metadata(CONDA_META_FILE), fp, indent=2)
+        fp.write("\n")
+    print(f"Written '{CONDA_META_JSON_FILE}' from '{CONDA_META_FILE}'")